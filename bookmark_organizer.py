@@ -4,47 +4,190 @@ Chrome Bookmarks Organizer
 Processes exported Chrome bookmarks to find duplicates and check connectivity.
 """
 
+import asyncio
 import csv
+import io
+import ipaddress
 import json
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+from aiohttp.abc import AbstractResolver
 from collections import defaultdict, Counter
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from lxml import etree
+from tqdm import tqdm
 from urllib.parse import urlparse
-import time
+from urllib.robotparser import RobotFileParser
+from yarl import URL
+import os
+import re
+import socket
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+# Sidecar holding ETag/Last-Modified per URL for conditional re-checks
+CACHE_FILE = '.bookmark_cache.json'
+
+# Append-only log of checked URLs so an interrupted run can resume
+CHECKPOINT_FILE = 'connectivity_checkpoint.jsonl'
+
+# Exports go through one large buffer so big reports need few write() calls
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Per-host pacing: back off on 429/503, ease up after a streak of successes
+MAX_HOST_DELAY = 60
+DELAY_STEP = 0.25
+SUCCESS_STREAK = 5
+MAX_RETRIES = 2
+
+# Fast path for the netloc of ordinary scheme://host/... URLs
+URL_NETLOC = re.compile(r'^[A-Za-z][A-Za-z0-9+.-]*://([^/?#]*)')
+
+def _netloc(url):
+    """Return the netloc of a URL, falling back to urlparse for unusual ones"""
+    match = URL_NETLOC.match(url)
+    return match.group(1) if match else urlparse(url).netloc
+
+def _skip_reason(url):
+    """Why a URL shouldn't be requested (non-web scheme or local host), or None"""
+    try:
+        parsed = urlparse(url)
+        host = parsed.hostname
+    except ValueError:
+        return 'Invalid URL'
+    
+    if parsed.scheme not in ('http', 'https'):
+        return f"Unsupported scheme '{parsed.scheme}'" if parsed.scheme else 'No scheme'
+    if not host:
+        return 'No host'
+    if host == 'localhost' or host.endswith('.localhost'):
+        return 'Local address'
+    
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return None
+    if address.is_private or address.is_unspecified:
+        return 'Local address'
+    return None
+
+def _retry_after(headers):
+    """Parse a Retry-After header (seconds or HTTP date) into seconds"""
+    value = headers.get('Retry-After', '')
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return max(0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return 0
+
+def _rejects_head(domain, status):
+    """Whether a HEAD response means the server doesn't support HEAD"""
+    if status in (405, 501):
+        return True
+    if status != 404:
+        return False
+    # Microsoft sites answer HEAD with 404 for pages that exist
+    host = (urlparse(f'//{domain}').hostname or '').rstrip('.')
+    return host == 'microsoft.com' or host.endswith('.microsoft.com')
+
+def _open_output(path):
+    """Open a UTF-8 text file for export behind a large write buffer"""
+    return io.TextIOWrapper(open(path, 'wb', buffering=OUTPUT_BUFFER_SIZE),
+                            encoding='utf-8', newline='')
+
+def _duplicate_details(dup):
+    """Describe a duplicate group for the duplicates CSV"""
+    if dup['type'] == 'duplicate_url':
+        return f"URL: {dup['url']} | Titles: {', '.join(dup['titles'])}"
+    return f"Title: {dup['title']} | URLs: {', '.join(dup['urls'])}"
+
+def _json_line(data):
+    """Encode a record as one line of JSONL bytes"""
+    if orjson is not None:
+        return orjson.dumps(data) + b'\n'
+    return json.dumps(data, ensure_ascii=False).encode('utf-8') + b'\n'
+
+def _write_json(path, data):
+    """Write pretty-printed JSON, encoding with orjson when it's available"""
+    if orjson is not None:
+        with open(path, 'wb') as file:
+            file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with _open_output(path) as file:
+            json.dump(data, file, indent=2, ensure_ascii=False)
+
+class CachingResolver(AbstractResolver):
+    """Resolve each host once per run and share the addresses across requests"""
+    
+    def __init__(self):
+        try:
+            self._resolver = aiohttp.AsyncResolver()
+        except RuntimeError:
+            # aiodns isn't installed
+            self._resolver = aiohttp.ThreadedResolver()
+        self._cache = {}
+    
+    async def resolve(self, host, port=0, family=socket.AF_UNSPEC):
+        key = (host, family)
+        if key not in self._cache:
+            self._cache[key] = asyncio.ensure_future(self._resolver.resolve(host, 0, family))
+        addresses = await asyncio.shield(self._cache[key])
+        return [{**address, 'port': port} for address in addresses]
+    
+    async def close(self):
+        await self._resolver.close()
+
 class BookmarkOrganizer:
     def __init__(self, bookmarks_file):
         self.bookmarks_file = bookmarks_file
-        self.bookmarks = []
+        # Bookmarks are stored as parallel arrays indexed by bookmark id
+        self.titles = []
+        self.urls = []
+        self.domains = []
         self.duplicates = []
+        self.url_groups = {}
         self.dead_links = []
         self.working_links = []
+        self.skipped_links = []
+        self.robots = {}
+        self.head_unsupported = set()
+        self.cache = {}
         
     def parse_bookmarks(self):
         """Parse Chrome bookmarks HTML file"""
         print("Parsing bookmarks file...")
         
         try:
-            with open(self.bookmarks_file, 'r', encoding='utf-8') as file:
-                soup = BeautifulSoup(file, 'html.parser')
-                
-            # Find all bookmark links
-            links = soup.find_all('a')
-            
-            for link in links:
+            # Stream bookmark links as they are parsed instead of building the whole tree
+            for _, link in etree.iterparse(self.bookmarks_file, events=('end',), tag='a',
+                                           html=True, encoding='utf-8'):
                 href = link.get('href')
-                title = link.get_text(strip=True)
+                title = ''.join(text.strip() for text in link.itertext())
                 
                 if href and title:
-                    self.bookmarks.append({
-                        'title': title,
-                        'url': href,
-                        'domain': urlparse(href).netloc
-                    })
+                    self.titles.append(title)
+                    self.urls.append(href)
+                    self.domains.append(_netloc(href))
+                
+                # Free the link and any already-processed siblings
+                link.clear(keep_tail=True)
+                for node in (link, link.getparent()):
+                    while node is not None and node.getprevious() is not None:
+                        del node.getparent()[0]
                     
-            print(f"Found {len(self.bookmarks)} bookmarks")
+            print(f"Found {len(self.urls)} bookmarks")
             
         except Exception as e:
             print(f"Error parsing bookmarks file: {e}")
@@ -54,104 +197,315 @@ class BookmarkOrganizer:
         """Find duplicate URLs and similar titles"""
         print("Checking for duplicates...")
         
-        # Check for duplicate URLs
-        url_counts = Counter(bookmark['url'] for bookmark in self.bookmarks)
-        duplicate_urls = {url: count for url, count in url_counts.items() if count > 1}
-        
-        # Check for duplicate titles (case-insensitive)
+        # Group bookmark ids by URL and by title (case-insensitive) in one pass
+        title_keys = [title.casefold().strip() for title in self.titles]
+        url_groups = self.url_groups = defaultdict(list)
         title_groups = defaultdict(list)
-        for bookmark in self.bookmarks:
-            title_lower = bookmark['title'].lower().strip()
-            title_groups[title_lower].append(bookmark)
+        for i, (url, title_key) in enumerate(zip(self.urls, title_keys)):
+            url_groups[url].append(i)
+            title_groups[title_key].append(i)
         
-        duplicate_titles = {title: bookmarks for title, bookmarks in title_groups.items() 
-                          if len(bookmarks) > 1}
-        
-        # Combine duplicates
-        seen_urls = set()
-        for bookmark in self.bookmarks:
-            url = bookmark['url']
-            title_lower = bookmark['title'].lower().strip()
-            
-            is_duplicate = False
-            
-            # Check if URL is duplicate
-            if url in duplicate_urls and url not in seen_urls:
-                duplicate_group = [b for b in self.bookmarks if b['url'] == url]
+        # Duplicate URLs
+        for url, ids in url_groups.items():
+            if len(ids) > 1:
                 self.duplicates.append({
                     'type': 'duplicate_url',
                     'url': url,
-                    'count': len(duplicate_group),
-                    'titles': [b['title'] for b in duplicate_group]
+                    'count': len(ids),
+                    'titles': [self.titles[i] for i in ids]
+                })
+        
+        # Duplicate titles (but different URLs)
+        for ids in title_groups.values():
+            if len(ids) > 1 and len({self.urls[i] for i in ids}) > 1:
+                self.duplicates.append({
+                    'type': 'duplicate_title',
+                    'title': self.titles[ids[0]],
+                    'urls': [self.urls[i] for i in ids],
+                    'count': len(ids)
                 })
-                seen_urls.add(url)
-                is_duplicate = True
-            
-            # Check if title is duplicate (but different URLs)
-            if title_lower in duplicate_titles and not is_duplicate:
-                similar_bookmarks = duplicate_titles[title_lower]
-                if len(set(b['url'] for b in similar_bookmarks)) > 1:  # Different URLs
-                    self.duplicates.append({
-                        'type': 'duplicate_title',
-                        'title': bookmark['title'],
-                        'urls': [b['url'] for b in similar_bookmarks],
-                        'count': len(similar_bookmarks)
-                    })
         
         print(f"Found {len(self.duplicates)} duplicate groups")
     
-    def test_connectivity(self, timeout=10, delay=0.5):
-        """Test each bookmark for connectivity"""
-        print(f"Testing connectivity for {len(self.bookmarks)} bookmarks...")
-        print("This may take a while...")
+    async def _check(self, session, i, sem, timeout):
+        """Check a single bookmark and return its status code and headers"""
+        url, domain = self.urls[i], self.domains[i]
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
         
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        # Revalidate against the previous run instead of re-fetching
+        cached = self.cache.get(url, {})
+        headers = {}
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
         
-        for i, bookmark in enumerate(self.bookmarks, 1):
-            url = bookmark['url']
-            
-            # Progress indicator
-            if i % 10 == 0:
-                print(f"Progress: {i}/{len(self.bookmarks)} ({i/len(self.bookmarks)*100:.1f}%)")
+        async with sem:
+            if domain not in self.head_unsupported:
+                async with session.head(url, headers=headers, timeout=client_timeout,
+                                        allow_redirects=True) as response:
+                    if not _rejects_head(domain, response.status):
+                        return self._update_cache(url, response.status, response.headers)
+                self.head_unsupported.add(domain)
             
+            # Fall back to GET, releasing the connection before any body is read
+            async with session.get(url, headers=headers, timeout=client_timeout,
+                                   allow_redirects=True) as response:
+                await response.release()
+                return self._update_cache(url, response.status, response.headers)
+    
+    def _update_cache(self, url, status, headers):
+        """Record validators for a response, resolving 304s from the cache"""
+        if status == 304 and url in self.cache:
+            return self.cache[url]['status'], headers
+        
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if 200 <= status < 300 and (etag or last_modified):
+            self.cache[url] = {'etag': etag, 'last_modified': last_modified, 'status': status}
+        else:
+            self.cache.pop(url, None)
+        return status, headers
+    
+    def _load_cache(self):
+        """Load validators saved by the previous run"""
+        try:
+            with open(CACHE_FILE, 'r', encoding='utf-8') as file:
+                self.cache = json.load(file)
+        except (OSError, ValueError):
+            self.cache = {}
+    
+    def _save_cache(self):
+        """Write the validator cache atomically so a crash can't corrupt it"""
+        tmp_file = f"{CACHE_FILE}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as file:
+            json.dump(self.cache, file, ensure_ascii=False)
+        os.replace(tmp_file, CACHE_FILE)
+    
+    async def _crawl_delay(self, session, domain, scheme, timeout):
+        """Return the robots.txt Crawl-delay for a host (cached per netloc)"""
+        if domain not in self.robots:
+            parser = RobotFileParser()
             try:
-                response = session.head(url, timeout=timeout, allow_redirects=True)
-                status_code = response.status_code
+                async with session.get(f"{scheme}://{domain}/robots.txt",
+                                       timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                    if response.status == 200:
+                        parser.parse((await response.text(errors='replace')).splitlines())
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+                pass
+            self.robots[domain] = parser.crawl_delay(HEADERS['User-Agent']) or 0
+        return min(float(self.robots[domain]), MAX_HOST_DELAY)
+    
+    async def _check_domain(self, session, domain, indices, sem, timeout, min_delay, record):
+        """Check all bookmarks on one host, pacing requests with AIMD backoff"""
+        try:
+            scheme = urlparse(self.urls[indices[0]]).scheme
+        except ValueError:
+            # Malformed URL (e.g. an unclosed IPv6 bracket); _check reports it as an error
+            scheme = ''
+        # The host's Crawl-delay is a floor that backoff never goes below. It
+        # only matters between requests, so single-URL hosts don't fetch robots.txt
+        floor = min_delay
+        if len(indices) > 1 and domain and scheme in ('http', 'https'):
+            async with sem:
+                crawl_delay = await self._crawl_delay(session, domain, scheme, timeout)
+            floor = max(min_delay, crawl_delay)
+        delay = floor
+        
+        successes = 0
+        for n, i in enumerate(indices):
+            if n:
+                await asyncio.sleep(delay)
+            
+            for attempt in range(MAX_RETRIES + 1):
+                try:
+                    status, headers = await self._check(session, i, sem, timeout)
+                except Exception as e:
+                    result = e
+                    break
                 
-                bookmark_result = {
-                    'title': bookmark['title'],
-                    'url': url,
-                    'status_code': status_code,
-                    'domain': bookmark['domain']
-                }
+                result = status
+                if status not in (429, 503):
+                    # Additive decrease once the host has been behaving
+                    successes += 1
+                    if successes >= SUCCESS_STREAK:
+                        delay = max(floor, delay - DELAY_STEP)
+                        successes = 0
+                    break
+                
+                # Multiplicative increase when the host pushes back
+                successes = 0
+                delay = min(MAX_HOST_DELAY, max(delay * 2, _retry_after(headers)))
+                if attempt < MAX_RETRIES:
+                    await asyncio.sleep(delay)
+            
+            record(self.urls[i], result)
+    
+    async def _test_connectivity_async(self, ids, timeout, delay, concurrency):
+        """Check the given bookmarks with all domains in parallel, one paced queue per domain"""
+        sem = asyncio.Semaphore(concurrency)
+        resolver = CachingResolver()
+        # Keep idle connections open longer than the slowest per-host pacing
+        # so consecutive requests to a host reuse the same TCP/TLS connection
+        connector = aiohttp.TCPConnector(limit=200, limit_per_host=8, resolver=resolver,
+                                         use_dns_cache=True, ttl_dns_cache=3600,
+                                         force_close=False, enable_cleanup_closed=True,
+                                         keepalive_timeout=MAX_HOST_DELAY + 5)
+        
+        domains = defaultdict(list)
+        for i in ids:
+            domains[self.domains[i]].append(i)
+        
+        # Resolve every host up front so the request storm never waits on DNS.
+        # Use the punycode host the connector resolves so the cache keys match
+        hosts = set()
+        for i in ids:
+            try:
+                hosts.add(URL(self.urls[i]).raw_host)
+            except ValueError:
+                continue
+        hosts.discard(None)
+        await asyncio.gather(*[resolver.resolve(host) for host in hosts], return_exceptions=True)
+        
+        results = {}
+        # Progress goes to stderr so stdout stays clean for pipelines
+        progress = tqdm(total=len(ids), unit='url', file=sys.stderr)
+        checkpoint = open(CHECKPOINT_FILE, 'ab', buffering=1 << 16)
+        if checkpoint.tell():
+            # Terminate any line cut short by an interrupted run
+            checkpoint.write(b'\n')
+        else:
+            checkpoint.write(_json_line(self._checkpoint_header()))
+        
+        def record(url, result):
+            results[url] = result
+            if not isinstance(result, Exception):
+                checkpoint.write(_json_line({'url': url, 'status_code': result}))
+            progress.update()
+        
+        try:
+            async with aiohttp.ClientSession(connector=connector, headers=HEADERS) as session:
+                tasks = [
+                    asyncio.create_task(
+                        self._check_domain(session, domain, indices, sem, timeout, delay, record))
+                    for domain, indices in domains.items()
+                ]
+                await asyncio.gather(*tasks)
+        finally:
+            checkpoint.close()
+            progress.close()
+            await resolver.close()
+        return results
+    
+    def _checkpoint_header(self):
+        """Identify the bookmarks export a checkpoint was written for"""
+        return {
+            'bookmarks_file': os.path.abspath(self.bookmarks_file),
+            'mtime': os.path.getmtime(self.bookmarks_file)
+        }
+    
+    def _load_checkpoint(self):
+        """Load status codes recorded by an interrupted run, keyed by URL"""
+        checked = {}
+        try:
+            with open(CHECKPOINT_FILE, 'rb') as file:
+                try:
+                    header = json.loads(file.readline())
+                except ValueError:
+                    header = None
                 
-                if status_code == 404:
-                    self.dead_links.append(bookmark_result)
-                elif 200 <= status_code < 400:
-                    self.working_links.append(bookmark_result)
+                if header == self._checkpoint_header():
+                    for line in file:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            # Blank or partially written line
+                            continue
+                        checked[entry['url']] = entry['status_code']
                 else:
-                    bookmark_result['note'] = f'HTTP {status_code}'
-                    self.dead_links.append(bookmark_result)
-                    
-            except requests.exceptions.RequestException as e:
-                error_bookmark = {
-                    'title': bookmark['title'],
-                    'url': url,
-                    'status_code': 'ERROR',
-                    'error': str(e),
-                    'domain': bookmark['domain']
-                }
+                    header = None
+        except OSError:
+            return checked
+        
+        if header is None:
+            # Left behind by a run on a different or since-modified export
+            os.remove(CHECKPOINT_FILE)
+        return checked
+    
+    def _bookmark_result(self, i, status_code):
+        """Materialize a result row for one bookmark"""
+        return {
+            'title': self.titles[i],
+            'url': self.urls[i],
+            'status_code': status_code,
+            'domain': self.domains[i]
+        }
+    
+    def test_connectivity(self, timeout=10, delay=0.5, concurrency=100):
+        """Test each bookmark for connectivity"""
+        print(f"Testing connectivity for {len(self.urls)} bookmarks...")
+        print("This may take a while...")
+        
+        # Test each unique URL once and share the result between its bookmarks
+        url_groups = self.url_groups
+        if not url_groups:
+            url_groups = defaultdict(list)
+            for i, url in enumerate(self.urls):
+                url_groups[url].append(i)
+        
+        # Don't send requests for non-web or local URLs
+        skipped = {}
+        for url in url_groups:
+            reason = _skip_reason(url)
+            if reason:
+                skipped[url] = reason
+        
+        # Skip URLs already checked by an interrupted run; errors are retried
+        checkpoint = self._load_checkpoint()
+        resumed = {url: checkpoint[url] for url in url_groups if url in checkpoint}
+        if resumed:
+            print(f"Resuming: {len(resumed)} URLs already checked")
+        ids = [group[0] for url, group in url_groups.items()
+               if url not in resumed and url not in skipped]
+        
+        self._load_cache()
+        try:
+            results = asyncio.run(self._test_connectivity_async(ids, timeout, delay, concurrency))
+        finally:
+            self._save_cache()
+        
+        # The run finished, so the next one should start from scratch
+        os.remove(CHECKPOINT_FILE)
+        results.update(resumed)
+        
+        for i, url in enumerate(self.urls):
+            if url in skipped:
+                skipped_bookmark = self._bookmark_result(i, 'SKIPPED')
+                skipped_bookmark['note'] = skipped[url]
+                self.skipped_links.append(skipped_bookmark)
+                continue
+            
+            result = results[url]
+            if isinstance(result, Exception):
+                error_bookmark = self._bookmark_result(i, 'ERROR')
+                error_bookmark['error'] = str(result) or type(result).__name__
                 self.dead_links.append(error_bookmark)
+                continue
+            
+            bookmark_result = self._bookmark_result(i, result)
             
-            # Small delay to be respectful to servers
-            time.sleep(delay)
+            if result == 404:
+                self.dead_links.append(bookmark_result)
+            elif 200 <= result < 400:
+                self.working_links.append(bookmark_result)
+            else:
+                bookmark_result['note'] = f'HTTP {result}'
+                self.dead_links.append(bookmark_result)
         
         print(f"Connectivity test complete!")
         print(f"Working links: {len(self.working_links)}")
         print(f"Dead/problematic links: {len(self.dead_links)}")
+        print(f"Skipped links: {len(self.skipped_links)}")
     
     def export_results(self):
         """Export results to CSV and JSON files"""
@@ -159,51 +513,56 @@ class BookmarkOrganizer:
         
         # Export dead links to CSV
         if self.dead_links:
-            with open('dead_bookmarks.csv', 'w', newline='', encoding='utf-8') as file:
+            with _open_output('dead_bookmarks.csv') as file:
                 writer = csv.DictWriter(file, fieldnames=['title', 'url', 'status_code', 'domain', 'error', 'note'])
                 writer.writeheader()
-                for link in self.dead_links:
-                    writer.writerow(link)
+                writer.writerows(self.dead_links)
             print(f"Exported {len(self.dead_links)} dead links to 'dead_bookmarks.csv'")
         
         # Export duplicates to CSV
         if self.duplicates:
-            with open('duplicate_bookmarks.csv', 'w', newline='', encoding='utf-8') as file:
+            with _open_output('duplicate_bookmarks.csv') as file:
                 writer = csv.writer(file)
                 writer.writerow(['Type', 'Details', 'Count'])
                 
-                for dup in self.duplicates:
-                    if dup['type'] == 'duplicate_url':
-                        details = f"URL: {dup['url']} | Titles: {', '.join(dup['titles'])}"
-                    else:
-                        details = f"Title: {dup['title']} | URLs: {', '.join(dup['urls'])}"
-                    
-                    writer.writerow([dup['type'], details, dup['count']])
+                rows = [[dup['type'], _duplicate_details(dup), dup['count']]
+                        for dup in self.duplicates]
+                writer.writerows(rows)
+                del rows
             print(f"Exported {len(self.duplicates)} duplicate groups to 'duplicate_bookmarks.csv'")
         
         # Export working links to CSV
         if self.working_links:
-            with open('working_bookmarks.csv', 'w', newline='', encoding='utf-8') as file:
+            with _open_output('working_bookmarks.csv') as file:
                 writer = csv.DictWriter(file, fieldnames=['title', 'url', 'status_code', 'domain'])
                 writer.writeheader()
                 writer.writerows(self.working_links)
             print(f"Exported {len(self.working_links)} working links to 'working_bookmarks.csv'")
         
+        # Export skipped links to CSV
+        if self.skipped_links:
+            with _open_output('skipped_bookmarks.csv') as file:
+                writer = csv.DictWriter(file, fieldnames=['title', 'url', 'status_code', 'domain', 'note'])
+                writer.writeheader()
+                writer.writerows(self.skipped_links)
+            print(f"Exported {len(self.skipped_links)} skipped links to 'skipped_bookmarks.csv'")
+        
         # Export complete results to JSON
         results = {
             'summary': {
-                'total_bookmarks': len(self.bookmarks),
+                'total_bookmarks': len(self.urls),
                 'working_links': len(self.working_links),
                 'dead_links': len(self.dead_links),
+                'skipped_links': len(self.skipped_links),
                 'duplicates': len(self.duplicates)
             },
             'dead_links': self.dead_links,
             'duplicates': self.duplicates,
-            'working_links': self.working_links
+            'working_links': self.working_links,
+            'skipped_links': self.skipped_links
         }
         
-        with open('bookmark_analysis.json', 'w', encoding='utf-8') as file:
-            json.dump(results, file, indent=2, ensure_ascii=False)
+        _write_json('bookmark_analysis.json', results)
         print("Exported complete analysis to 'bookmark_analysis.json'")
     
     def print_summary(self):
@@ -211,9 +570,10 @@ class BookmarkOrganizer:
         print("\n" + "="*50)
         print("BOOKMARK ANALYSIS SUMMARY")
         print("="*50)
-        print(f"Total bookmarks processed: {len(self.bookmarks)}")
+        print(f"Total bookmarks processed: {len(self.urls)}")
         print(f"Working links: {len(self.working_links)}")
         print(f"Dead/problematic links: {len(self.dead_links)}")
+        print(f"Skipped (non-web/local) links: {len(self.skipped_links)}")
         print(f"Duplicate groups found: {len(self.duplicates)}")
         
         if self.dead_links: